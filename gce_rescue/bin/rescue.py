@@ -20,9 +20,6 @@ from datetime import datetime
 import logging
 
 from gce_rescue.config import process_args, set_configs
-from gce_rescue import messages
-from gce_rescue.gce import Instance
-from gce_rescue.tasks.actions import call_tasks
 from gce_rescue.utils import read_input, set_logging
 
 def main():
@@ -31,6 +28,13 @@ def main():
   args = parser.parse_args()
   set_configs(args)
 
+  # Deferred so --help and usage errors don't pay for the Google API client.
+  # pylint: disable=import-outside-toplevel
+  from googleapiclient.errors import HttpError
+  from gce_rescue import messages
+  from gce_rescue.gce import Instance
+  from gce_rescue.tasks.actions import call_tasks
+
   set_logging(vm_name=args.name)
 
   parse_kwargs = {
@@ -54,7 +58,6 @@ def main():
     # save in the log file current configuration of the VM as backup.
     logging.info('RESTORE#%s\n', vm.data)
     action = 'set_rescue_mode'
-    msg = messages.tip_connect_ssh(vm)
 
   else:
     rescue_ts = vm.rescue_mode_status['ts']
@@ -68,10 +71,21 @@ def main():
 
     print('Restoring VM...')
     action = 'reset_rescue_mode'
-    has_snapshot = vm.snapshot
-    msg = messages.tip_restore_disk(vm, snapshot=has_snapshot)
 
   call_tasks(vm=vm, action=action)
+
+  # Only build the closing tip (and look up the snapshot) once the tasks
+  # succeeded and the message is actually going to be shown.
+  if not rescue_on:
+    msg = messages.tip_connect_ssh(vm)
+  else:
+    # The restore already succeeded, a failed lookup only drops the tip.
+    try:
+      snapshot = vm.snapshot
+    except HttpError as e:
+      logging.error('Unable to look up the rescue snapshot: %s', e)
+      snapshot = ''
+    msg = messages.tip_restore_disk(vm, snapshot=snapshot)
   print(msg)
 
 
@@ -21,6 +21,9 @@ dirname = os.path.dirname(__file__)
 
 VERSION = '0.5-beta'
 
+_DESCRIPTION = (f'GCE Rescue v{VERSION} - '
+                'Set/Reset GCE instances to boot in rescue mode.')
+
 config = {
   'version': VERSION,
   'debug': False,
@@ -43,25 +46,45 @@ def get_config(key):
     return config[key]
 
 
+_ARGUMENTS = (
+  (('-p', '--project'), {
+    'help': 'The project-id that has the instance.'
+  }),
+  (('-z', '--zone'), {
+    'help': 'Zone where the instance is created.',
+    'required': True
+  }),
+  (('-n', '--name'), {
+    'help': 'Instance name.',
+    'required': True
+  }),
+  (('-d', '--debug'), {
+    'action': 'store_true',
+    'help': 'Print to the log file in debug leve'
+  }),
+  (('-f', '--force'), {
+    'action': 'store_true',
+    'help': 'Don\'t ask for confirmation.'
+  }),
+  (('--skip-snapshot',), {
+    'action': 'store_true',
+    'help': 'Skip backing up the disk using a snapshot.'
+  }),
+  (('--version',), {
+    'action': 'version',
+    'version': f'%(prog)s v{VERSION}'
+  }),
+)
+
+
 def process_args():
   """ Print usage options. """
-  parser = argparse.ArgumentParser(description=f'GCE Rescue v{VERSION} - \
-    Set/Reset GCE instances to boot in rescue mode.')
-  parser.add_argument('-p', '--project',
-                      help='The project-id that has the instance.')
-  parser.add_argument('-z', '--zone', help='Zone where the instance \
-    is created.',
-                      required=True)
-  parser.add_argument('-n', '--name', help='Instance name.', required=True)
-  parser.add_argument('-d', '--debug', action='store_true',
-                      help='Print to the log file in debug leve')
-  parser.add_argument('-f', '--force', action='store_true',
-                      help='Don\'t ask for confirmation.')
-  parser.add_argument('--skip-snapshot', action='store_true',
-                      help='Skip backing up the disk using a snapshot.')
+  parser = argparse.ArgumentParser(description=_DESCRIPTION)
+  for flags, kwargs in _ARGUMENTS:
+    parser.add_argument(*flags, **kwargs)
   return parser
 
 
 def set_configs(user_args):
-  config['debug'] = getattr(user_args, 'debug')
-  config['skip-snapshot'] = getattr(user_args, 'skip_snapshot')
+  config['debug'] = user_args.debug
+  config['skip-snapshot'] = user_args.skip_snapshot
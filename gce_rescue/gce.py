@@ -30,7 +30,8 @@ from gce_rescue.config import get_config
 def get_instance_info(
   compute: Resource,
   name: str,
-  project_data: Dict[str, str]
+  project_data: Dict[str, str],
+  fields: str = None
 ) -> Dict:
   """Set Dictionary with complete data from instances().get() from the instance.
   https://cloud.google.com/compute/docs/reference/rest/v1/instances/get
@@ -39,7 +40,10 @@ def get_instance_info(
     instance: str, Instace name
     project_data: dict, Dictionary containing project and zone keys to be
       unpacked when calling the API.
+    fields: str, Optional partial response mask, e.g. 'metadata/fingerprint'.
   """
+  if fields:
+    project_data = {**project_data, 'fields': fields}
   return compute.instances().get(
       **project_data,
       instance = name).execute()
@@ -50,37 +54,34 @@ def guess_guest(data: Dict) -> str:
      Default: projects/debian-cloud/global/images/family/debian-11"""
 
   guests = get_config('source_guests')
-  for disk in data['disks']:
-    if disk['boot']:
-      if 'architecture' in disk:
-        arch = disk['architecture'].lower()
-      else:
-        arch = 'x86_64'
-      guest_default = guests[arch][0]
-      guest_name = guest_default.split('/')[-1]
-      for lic in disk['licenses']:
-        if guest_name in lic:
-          guest_default = guests[arch][1]
+  boot_disk = next(disk for disk in data['disks'] if disk['boot'])
+  arch = boot_disk.get('architecture', 'x86_64').lower()
+  guest_default = guests[arch][0]
+  guest_name = guest_default.rpartition('/')[2]
+  # Use the alternative image when the guest runs the default one.
+  if any(guest_name in lic for lic in boot_disk['licenses']):
+    return guests[arch][1]
   return guest_default
 
 
 def validate_instance_mode(data: Dict) -> Dict:
   """Validate if the instance is already configured as rescue mode."""
 
-  result = {
+  items = data.get('metadata', {}).get('items', ())
+  rescue_ts = next(
+    (item['value'] for item in items if item['key'] == 'rescue-mode'),
+    None
+  )
+  if rescue_ts is not None:
+    return {
+      'rescue-mode': True,
+      'ts': rescue_ts
+    }
+
+  return {
       'rescue-mode': False,
       'ts': generate_ts()
   }
-  if 'metadata' in data and 'items' in data['metadata']:
-    metadata = data['metadata']
-    for item in metadata['items']:
-      if item['key'] == 'rescue-mode':
-        result = {
-          'rescue-mode': True,
-          'ts': item['value']
-        }
-
-  return result
 
 def generate_ts() -> int:
   """Get the current timestamp to be used as unique ID
@@ -117,7 +118,7 @@ class Instance(Resource):
     try:
       self.compute = check.compute
       self.project = check.adc_project
-      self.data = get_instance_info(
+      self.data = check.instance_data or get_instance_info(
         compute=self.compute,
         name=self.name,
         project_data=self.project_data)
@@ -142,7 +143,8 @@ class Instance(Resource):
     project_data = get_instance_info(
         compute=self.compute,
         name=self.name,
-        project_data=self.project_data)
+        project_data=self.project_data,
+        fields='metadata/fingerprint')
 
     new_fingerprint = project_data['metadata']['fingerprint']
     self.data['metadata']['fingerprint'] = new_fingerprint
@@ -152,11 +154,9 @@ class Instance(Resource):
 
     rescue_on = self._rescue_mode_status['rescue-mode']
     if not rescue_on:
-      for disk in self.data['disks']:
-        if disk['boot']:
-          device_name = disk['deviceName']
-          source = disk['source']
-          disk_name = source.split('/')[-1]
+      boot_disk = next(disk for disk in self.data['disks'] if disk['boot'])
+      device_name = boot_disk['deviceName']
+      disk_name = boot_disk['source'].rpartition('/')[2]
 
     else:
       ts = self._rescue_mode_status['ts']
@@ -169,12 +169,12 @@ class Instance(Resource):
       )
 
       disk_name = disk[0]['name']
-      disks = self.data['disks']
-      for disk in disks:
-        full_source = disk['source']
-        source = full_source.split('/')[-1]
-        if disk_name == source:
-          device_name = disk['deviceName']
+      # A restore that failed half way can leave the original disk detached,
+      # fall back to the disk name as device name to re-attach it.
+      device_name = next((
+        disk['deviceName'] for disk in self.data['disks']
+        if disk['source'].rpartition('/')[2] == disk_name
+      ), disk_name)
 
     result = {
         'device_name': device_name,
@@ -190,6 +190,11 @@ class Instance(Resource):
   def project_data(self) -> str:
     return {'project': self.project, 'zone': self.zone}
 
+  @property
+  def zone_path(self) -> str:
+    """Relative resource path of the instance zone, used to build URLs."""
+    return f'projects/{self.project}/zones/{self.zone}'
+
   @property
   def rescue_disk(self) -> str:
     return f'linux-rescue-disk-{self.ts}'
@@ -47,6 +47,10 @@ class RescueTest(absltest.TestCase):
       }
     )
     self.assertTrue(len(self.vm.backup_items) > 0)
+    self.assertEqual(
+      self.vm.zone_path,
+      f'projects/{MOCK_TEST_DATA["project"]}/zones/{MOCK_TEST_DATA["zone"]}'
+    )
 
 
   def test_define_disks(self):
@@ -14,13 +14,15 @@
 
 """ List of ordered tasks to be executed when set/reset VM rescue mode. """
 
-from typing import List
+from typing import Callable, Dict, List, Tuple
 import logging
 
 from gce_rescue.gce import Instance
 from gce_rescue.tasks.disks import (
   take_snapshot,
   create_rescue_disk,
+  discard_rescue_disk,
+  start_rescue_disk,
   restore_original_disk,
   attach_disk
 )
@@ -32,116 +34,90 @@ from gce_rescue.tasks.metadata import (
   set_metadata,
   restore_metadata_items
 )
-from gce_rescue.utils import Tracker
+from gce_rescue.utils import Tracker, ThreadHandler as Handler
 from gce_rescue.config import get_config
 _logger = logging.getLogger(__name__)
 
-def _list_tasks(vm: Instance, action: str) -> List:
+def _task(function: Callable, **kwargs) -> Tuple[Callable, Dict]:
+  """ Task entry calling function with the given keyword arguments. """
+  return function, kwargs
+
+
+def _set_rescue_mode_tasks(vm: Instance, disk_task: Handler = None) -> List:
+  """ Tasks to boot the instance in rescue mode. disk_task is the rescue
+  disk creation already started by start_rescue_disk(), if any. """
+  return [
+    _task(stop_instance, vm=vm),
+    _task(create_rescue_disk, vm=vm, disk_task=disk_task),
+    _task(set_metadata, vm=vm),
+    _task(start_instance, vm=vm),
+    _task(attach_disk, vm=vm, boot=False, **vm.disks),
+    _task(restore_metadata_items, vm=vm),
+  ]
+
+
+def _reset_rescue_mode_tasks(vm: Instance) -> List:
+  """ Tasks to restore the instance original configuration. """
+  return [
+    _task(stop_instance, vm=vm),
+    _task(restore_original_disk, vm=vm),
+    _task(restore_metadata_items, vm=vm, remove_rescue_mode=True),
+    _task(start_instance, vm=vm),
+  ]
+
+
+_ACTIONS = {
+  'set_rescue_mode': _set_rescue_mode_tasks,
+  'reset_rescue_mode': _reset_rescue_mode_tasks,
+}
+
+
+def _list_tasks(vm: Instance, action: str, **kwargs) -> List:
   """ List tasks, by order, per operation
     operations (str):
       1. set_rescue_mode
       2. reset_rescue_mode
+    Only the task list of the requested operation is built.
   """
-  all_tasks = {
-    'set_rescue_mode': [
-      {
-        'name': stop_instance,
-        'args': [{
-          'vm': vm
-        }]
-      },
-      {
-        'name': create_rescue_disk,
-        'args': [{
-          'vm': vm
-        }]
-      },
-      {
-        'name': set_metadata,
-        'args': [{
-          'vm': vm
-        }]
-      },
-      {
-        'name': start_instance,
-        'args': [{
-          'vm': vm
-        }]
-      },
-      {
-        'name': attach_disk,
-        'args': [{
-          'vm': vm,
-          'boot': False,
-          **vm.disks
-        }],
-      },
-      {
-        'name': restore_metadata_items,
-        'args': [{
-          'vm': vm
-        }],
-      }
-  ],
-    'reset_rescue_mode': [
-      {
-        'name': stop_instance,
-        'args': [{
-          'vm': vm
-        }]
-      },
-      {
-        'name': restore_original_disk,
-        'args': [{
-          'vm': vm
-        }]
-      },
-      {
-        'name': restore_metadata_items,
-        'args': [{
-          'vm': vm,
-          'remove_rescue_mode': True
-        }]
-      },
-      {
-        'name': start_instance,
-        'args': [{
-          'vm': vm
-        }]
-      },
-    ]
-  }
-
-  if action not in all_tasks:
-    _logger.info(f'Unable to find "{action}".')
+  if action not in _ACTIONS:
+    _logger.info('Unable to find "%s".', action)
     raise ValueError()
-  return all_tasks[action]
+  return _ACTIONS[action](vm, **kwargs)
 
 
 def call_tasks(vm: Instance, action: str) -> None:
   """ Loop tasks dict and execute """
-  tasks = _list_tasks(vm = vm, action = action)
   async_backup_thread = None
+  disk_task = None
+  task_kwargs = {}
   if action == 'set_rescue_mode':
     if get_config('skip-snapshot'):
-      _logger.info(f'Skipping snapshot backup.')
+      _logger.info('Skipping snapshot backup.')
     else:
-      take_snapshot(vm)
-      async_backup_thread = True
+      async_backup_thread = take_snapshot(vm)
+    # Create the rescue disk while the instance is stopping.
+    disk_task = start_rescue_disk(vm)
+    task_kwargs['disk_task'] = disk_task
+  tasks = _list_tasks(vm = vm, action = action, **task_kwargs)
   total_tasks = len(tasks)
 
   tracker = Tracker(total_tasks)
   tracker.start()
 
-  for task in tasks:
-    execute = task['name']
-    args = task['args'][0]
-
-    execute(**args)
-    tracker.advance(step = 1)
+  try:
+    for execute, args in tasks:
+      if execute is create_rescue_disk:
+        # From here on create_rescue_disk() owns the disk.
+        disk_task = None
+      execute(**args)
+      tracker.advance(step = 1)
+  except Exception:
+    if disk_task is not None:
+      discard_rescue_disk(vm, disk_task)
+    raise
 
   if async_backup_thread:
-    _logger.info(f'Waiting for async backup to finish')
-    take_snapshot(vm, join_snapshot=True)
+    _logger.info('Waiting for async backup to finish')
+    async_backup_thread.join()
     _logger.info('done.')
   tracker.finish()
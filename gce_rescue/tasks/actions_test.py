@@ -0,0 +1,75 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test code for actions.py."""
+
+from unittest import mock
+
+from absl.testing import absltest
+
+from gce_rescue.gce import Instance
+from gce_rescue.tasks import actions
+from gce_rescue.test.mocks import MOCK_TEST_VM
+from gce_rescue.utils import ThreadHandler as Handler
+
+
+class ActionsTest(absltest.TestCase):
+  def setUp(self):
+    self.vm = Instance(test_mode=True, **MOCK_TEST_VM)
+    for name in ('Tracker', 'take_snapshot'):
+      patcher = mock.patch.object(actions, name)
+      patcher.start()
+      self.addCleanup(patcher.stop)
+
+
+  def test_list_tasks_has_no_side_effects(self):
+    with mock.patch.object(actions, 'start_rescue_disk') as start_disk:
+      tasks = actions._list_tasks(  # pylint: disable=protected-access
+        vm=self.vm, action='set_rescue_mode')
+    start_disk.assert_not_called()
+    self.assertIn(actions.create_rescue_disk, [task[0] for task in tasks])
+
+
+  def test_failed_stop_discards_rescue_disk(self):
+    """The background rescue disk is deleted when the rescue is aborted
+    before the disk was attached."""
+    disk_task = Handler(target=lambda: {})
+    disk_task.start()
+    with mock.patch.object(
+        actions, 'start_rescue_disk', return_value=disk_task), \
+        mock.patch.object(
+          actions, 'stop_instance', side_effect=Exception('stop failed')), \
+        mock.patch('gce_rescue.tasks.disks._delete_rescue_disk') as delete:
+      with self.assertRaisesRegex(Exception, 'stop failed'):
+        actions.call_tasks(vm=self.vm, action='set_rescue_mode')
+    delete.assert_called_once_with(self.vm, disk_name=self.vm.rescue_disk)
+
+
+  def test_failure_after_attach_keeps_rescue_disk(self):
+    disk_task = Handler(target=lambda: {})
+    disk_task.start()
+    with mock.patch.object(
+        actions, 'start_rescue_disk', return_value=disk_task), \
+        mock.patch.object(actions, 'stop_instance'), \
+        mock.patch.object(actions, 'create_rescue_disk'), \
+        mock.patch.object(
+          actions, 'set_metadata', side_effect=Exception('metadata failed')), \
+        mock.patch('gce_rescue.tasks.disks._delete_rescue_disk') as delete:
+      with self.assertRaisesRegex(Exception, 'metadata failed'):
+        actions.call_tasks(vm=self.vm, action='set_rescue_mode')
+    delete.assert_not_called()
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -26,9 +26,7 @@ def backup_metadata_items(data: Dict) -> List:
   at the end of the process. After the instance booted and executed
   the rescue start-script
   """
-  if 'items' in data['metadata'].keys():
-    return data['metadata']['items']
-  return []
+  return data['metadata'].get('items', [])
 
 def create_snapshot(vm) -> Dict:
   """
@@ -46,7 +44,7 @@ def create_snapshot(vm) -> Dict:
     'name': snapshot_name,
     'storageLocations': [ region ]
   }
-  _logger.info(f'Creating snapshot {snapshot_body}... ')
+  _logger.info('Creating snapshot %s... ', snapshot_body)
   operation = vm.compute.disks().createSnapshot(
     **vm.project_data,
     disk = disk_name,
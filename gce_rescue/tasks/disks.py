@@ -26,7 +26,6 @@ from gce_rescue.utils import ThreadHandler as Handler
 from googleapiclient.errors import HttpError
 
 _logger = logging.getLogger(__name__)
-snapshot_thread = None
 
 def _create_rescue_disk(vm, source_disk: str) -> Dict:
   """ Create new temporary rescue disk based on source_disk.
@@ -39,7 +38,8 @@ def _create_rescue_disk(vm, source_disk: str) -> Dict:
   try:
     chk_disk_exist = vm.compute.disks().get(
       **vm.project_data,
-      disk = vm.rescue_disk).execute()
+      disk = vm.rescue_disk,
+      fields = 'name,users').execute()
   except googleapiclient.errors.HttpError as e:
     if e.status_code == 404:
       _logger.info('Creating rescue disk %s...', vm.rescue_disk)
@@ -58,7 +58,7 @@ def _create_rescue_disk(vm, source_disk: str) -> Dict:
   disk_body = {
     'name': vm.rescue_disk,
     'sourceImage': source_disk,
-    'type': f'projects/{vm.project}/zones/{vm.zone}/diskTypes/pd-balanced'
+    'type': f'{vm.zone_path}/diskTypes/pd-balanced'
   }
   operation = vm.compute.disks().insert(
     **vm.project_data,
@@ -106,9 +106,15 @@ def _delete_rescue_disk(vm, disk_name: str) -> Dict:
     operation-result: Dict
   """
   _logger.info('Deleting disk %s...', disk_name)
-  operation = vm.compute.disks().delete(
-    **vm.project_data,
-    disk = disk_name).execute()
+  try:
+    operation = vm.compute.disks().delete(
+      **vm.project_data,
+      disk = disk_name).execute()
+  except HttpError as e:
+    if e.status_code != 404:
+      raise
+    _logger.info('Disk %s was already deleted. Skipping...', disk_name)
+    return {}
 
   result = wait_for_operation(vm, oper=operation)
   return result
@@ -120,9 +126,11 @@ def list_disk(vm, project_data: Dict, label_filter: str) -> Dict:
   Returns:
     result: Dict
   """
+  # Callers only need the disk name and label fingerprint.
   result = vm.compute.disks().list(
     **project_data,
-    filter=label_filter).execute()
+    filter=label_filter,
+    fields='items(name,labelFingerprint)').execute()
 
   #TODO: Add validation and throw exception if response has more than 1 disk:
   #  len(response['items'])
@@ -154,7 +162,7 @@ def attach_disk(
     'name': disk_name,
     'deviceName': device_name,
     'type': 'PERSISTENT',
-    'source': f'projects/{vm.project}/zones/{vm.zone}/disks/{disk_name}'
+    'source': f'{vm.zone_path}/disks/{disk_name}'
   }
   _logger.info('Attaching disk %s...', disk_name)
   operation = vm.compute.instances().attachDisk(
@@ -180,28 +188,47 @@ def _detach_disk(vm, disk: str) -> Dict:
   return result
 
 
-def take_snapshot(vm, join_snapshot=None) -> None:
-  global snapshot_thread
-  if not join_snapshot:
-    snapshot_thread = Thread(target=create_snapshot, args=(vm,), daemon=True)
-    snapshot_thread.start()
-  else:
-    snapshot_thread.join()
+def take_snapshot(vm) -> Thread:
+  """Start the boot disk snapshot in the background. The caller joins the
+  returned thread once the other tasks are done."""
+  snapshot_thread = Thread(target=create_snapshot, args=(vm,), daemon=True)
+  snapshot_thread.start()
+  return snapshot_thread
 
 
-def create_rescue_disk(vm) -> None:
+def start_rescue_disk(vm) -> Handler:
+  """Start creating the rescue disk in the background. It doesn't depend on
+  the instance state, so it can overlap with stopping the instance."""
+  task = Handler(
+    target = _create_rescue_disk,
+    kwargs={'vm': vm, 'source_disk': vm.rescue_source_disk}
+    )
+  task.start()
+  return task
+
+
+def discard_rescue_disk(vm, disk_task: Handler) -> None:
+  """Wait for a disk started by start_rescue_disk() and delete it, when the
+  rescue is aborted before the disk was attached."""
+  try:
+    disk_task.result()
+    _delete_rescue_disk(vm, disk_name=vm.rescue_disk)
+  except Exception:  # pylint: disable=broad-exception-caught
+    _logger.exception(
+      'Unable to clean up rescue disk %s, please delete it manually.',
+      vm.rescue_disk)
+
+
+def create_rescue_disk(vm, disk_task: Handler = None) -> None:
   device_name = vm.disks['device_name']
   # task1 = multitasks.Handler(
   #     target = backup,
   #     kwargs={'vm' : vm}
   #     )
   # task1.start()
-  task2 = Handler(
-    target = _create_rescue_disk,
-    kwargs={'vm': vm, 'source_disk': vm.rescue_source_disk}
-    )
-  task2.start()
-  task2.join()
+  if disk_task is None:
+    disk_task = start_rescue_disk(vm)
+  disk_task.result()
   _detach_disk(vm, disk=device_name)
   attach_disk(
     vm,
@@ -215,9 +242,12 @@ def list_snapshot(vm) -> str:
   try:
     vm.compute.snapshots().get(
       snapshot=snapshot_name,
-      project=vm.project
+      project=vm.project,
+      fields='name'
     ).execute()
-  except HttpError:
+  except HttpError as e:
+    if e.status_code != 404:
+      raise
     _logger.info('Snapshot was not found for VM in active rescue mode')
     return ''
   return snapshot_name
@@ -225,8 +255,26 @@ def list_snapshot(vm) -> str:
 def restore_original_disk(vm) -> None:
   """ Restore tasks to the original disk """
   device_name = vm.disks['device_name']
-
-  _detach_disk(vm, disk=vm.rescue_disk)
-  _detach_disk(vm, disk=device_name)
+  disk_name = vm.disks['disk_name']
+
+  # A previous run may have failed half way, skip the steps that are already
+  # done instead of failing on detachDisk or attachDisk.
+  attached = {disk['deviceName'] for disk in vm.data['disks']}
+  original_boot = any(
+    disk['boot'] and disk['source'].rpartition('/')[2] == disk_name
+    for disk in vm.data['disks']
+  )
+  to_detach = [vm.rescue_disk]
+  if not original_boot:
+    to_detach.append(device_name)
+  for disk in to_detach:
+    if disk in attached:
+      _detach_disk(vm, disk=disk)
+    else:
+      _logger.info('Disk %s is not attached to %s. Skipping...', disk, vm.name)
   _delete_rescue_disk(vm, disk_name=vm.rescue_disk)
-  attach_disk(vm, **vm.disks, boot=True)
+  if original_boot:
+    _logger.info('Disk %s is already the boot disk of %s. Skipping...',
+                 disk_name, vm.name)
+  else:
+    attach_disk(vm, **vm.disks, boot=True)
@@ -19,6 +19,7 @@ from absl import logging
 
 from gce_rescue.gce import Instance
 from gce_rescue.tasks import disks
+from gce_rescue.utils import ThreadHandler as Handler
 from gce_rescue.test.mocks import (
   mock_api_object,
   MOCK_TEST_VM,
@@ -76,6 +77,28 @@ class DisksTest(absltest.TestCase):
     disks.create_rescue_disk(self.vm)
 
 
+  def test_create_rescue_disk_waits_for_disk_task(self):
+    """A disk creation started earlier is waited on, not started again."""
+    disk_task = Handler(target=lambda: {})
+    disk_task.start()
+    self.vm.compute = mock_api_object([
+      'operations',
+      'operations',
+    ])
+    disks.create_rescue_disk(self.vm, disk_task=disk_task)
+
+
+  def test_create_rescue_disk_raises_disk_task_error(self):
+    def failing_insert():
+      raise Exception('insert failed')
+
+    disk_task = Handler(target=failing_insert)
+    disk_task.start()
+    self.vm.compute = mock_api_object([])
+    with self.assertRaisesRegex(Exception, 'insert failed'):
+      disks.create_rescue_disk(self.vm, disk_task=disk_task)
+
+
   def test_restore_original_disk(self):
     self.vm.compute = mock_api_object([
       'operations',
@@ -86,5 +109,66 @@ class DisksTest(absltest.TestCase):
     disks.restore_original_disk(self.vm)
 
 
+  def _rescue_mode(self, attached_disks):
+    """Reload self.vm as a rescue mode instance with attached_disks."""
+    self.vm.compute = mock_api_object(['disks'])
+    self.vm.data['disks'] = attached_disks
+    self.vm._rescue_mode_status = {  # pylint: disable=protected-access
+      'rescue-mode': True,
+      'ts': self.vm.ts
+    }
+    self.vm._disks = self.vm._define_disks()  # pylint: disable=protected-access
+
+
+  def test_restore_original_disk_skips_detached(self):
+    """An original disk left detached by a failed restore is re-attached
+    without trying to detach it again."""
+    rescue_disk = {
+      'deviceName': self.vm.rescue_disk,
+      'source': f'{self.vm.zone_path}/disks/{self.vm.rescue_disk}',
+      'boot': True
+    }
+    self._rescue_mode([rescue_disk])
+    self.assertEqual(self.vm.disks, {
+      'device_name': MOCK_TEST_DATA['disk'],
+      'disk_name': MOCK_TEST_DATA['disk']
+    })
+    self.vm.compute = mock_api_object([
+      'operations',
+      'operations',
+      'operations',
+    ])
+    with self.assertLogs(disks.__name__, level='INFO') as logs:
+      disks.restore_original_disk(self.vm)
+    detached = [line for line in logs.output if 'Detaching' in line]
+    self.assertLen(detached, 1)
+    self.assertIn(self.vm.rescue_disk, detached[0])
+    self.assertTrue(any('not attached' in line for line in logs.output))
+
+
+  def test_restore_original_disk_already_boot(self):
+    """An original disk that is already the boot disk is left in place."""
+    original_disk = self.instance_data['disks'][0]
+    self._rescue_mode([original_disk])
+    self.vm.compute = mock_api_object(['operations'])
+    with self.assertLogs(disks.__name__, level='INFO') as logs:
+      disks.restore_original_disk(self.vm)
+    self.assertFalse(any('Detaching' in line for line in logs.output))
+    self.assertTrue(any('already the boot disk' in line
+                        for line in logs.output))
+
+
+  def test_restore_original_disk_skips_deleted_disk(self):
+    """A rescue disk that is already gone is not an error."""
+    self.vm.data['disks'] = []
+    self.vm.compute = mock_api_object([
+      'not_found',
+      'operations',
+    ])
+    with self.assertLogs(disks.__name__, level='INFO') as logs:
+      disks.restore_original_disk(self.vm)
+    self.assertTrue(any('already deleted' in line for line in logs.output))
+
+
 if __name__ == '__main__':
   absltest.main()
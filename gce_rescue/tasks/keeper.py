@@ -17,7 +17,7 @@
 """keeper that the progress of the tasks. """
 
 import googleapiclient.discovery
-from time import sleep
+from time import monotonic, sleep
 from typing import Dict
 import logging
 import json
@@ -38,16 +38,21 @@ def wait_for_operation(
         raise Exception(oper['error'])
       return oper
 
-    oper = instance_obj.compute.zoneOperations().get(
+    # zoneOperations().wait() blocks server side until the operation is DONE
+    # (or about two minutes passed), so no client side sleep is needed.
+    oper = instance_obj.compute.zoneOperations().wait(
       **instance_obj.project_data,
       operation = oper['name']).execute()
-    sleep(1)
 
 def wait_for_os_boot(vm: googleapiclient.discovery.Resource) -> bool:
   """Wait guest OS to complete the boot proccess."""
 
   timeout = 60
-  wait_time = 2
+  deadline = monotonic() + timeout
+  # Poll right away, then back off (0.5s, 1s) to the old fixed 2s interval,
+  # so the END marker is never noticed more than 2s late.
+  wait_time = 0.5
+  max_wait_time = 2
   end_string = f'END:{vm.ts}'
   _logger.info('Waiting startup-script to complete.')
   while True:
@@ -60,7 +65,10 @@ def wait_for_os_boot(vm: googleapiclient.discovery.Resource) -> bool:
       _logger.info('startup-script has ended.')
       return True
 
-    sleep(wait_time)
-    timeout -= wait_time
-    if not timeout:
+    # Measure against the deadline so slow API calls count towards the
+    # timeout too.
+    remaining = deadline - monotonic()
+    if remaining <= 0:
       return False
+    sleep(min(wait_time, remaining))
+    wait_time = min(wait_time * 2, max_wait_time)
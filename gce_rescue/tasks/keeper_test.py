@@ -0,0 +1,61 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test code for keeper.py."""
+
+from unittest import mock
+
+from absl.testing import absltest
+from gce_rescue.gce import Instance
+from gce_rescue.tasks.keeper import wait_for_operation, wait_for_os_boot
+from gce_rescue.test.mocks import mock_api_object, MOCK_TEST_VM
+
+
+class KeeperTest(absltest.TestCase):
+  vm: Instance
+
+
+  def setUp(self):
+    self.vm = Instance(test_mode=True, **MOCK_TEST_VM)
+
+
+  def test_wait_for_operation_pending(self):
+    """A pending operation is waited on until the API reports it DONE."""
+    self.vm.compute = mock_api_object(['operations'])
+    pending = {'name': 'operation-mock', 'status': 'RUNNING'}
+    result = wait_for_operation(self.vm, oper=pending)
+    self.assertEqual(result['status'], 'DONE')
+
+
+  def test_wait_for_operation_error(self):
+    """A finished operation carrying an error raises."""
+    failed = {'name': 'operation-mock', 'status': 'DONE', 'error': {}}
+    with self.assertRaises(Exception):
+      wait_for_operation(self.vm, oper=failed)
+
+
+  def test_wait_for_os_boot_caps_poll_interval(self):
+    """Serial port polling backs off but never waits more than 2s."""
+    self.vm.compute = mock.MagicMock()
+    output = [{'contents': ''}] * 5 + [{'contents': f'END:{self.vm.ts}'}]
+    get_output = self.vm.compute.instances().getSerialPortOutput
+    get_output.return_value.execute.side_effect = output
+    with mock.patch('gce_rescue.tasks.keeper.sleep') as sleep:
+      self.assertTrue(wait_for_os_boot(self.vm))
+    waits = [call.args[0] for call in sleep.call_args_list]
+    self.assertEqual(waits, [0.5, 1, 2, 2, 2])
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -16,11 +16,19 @@
 
 from gce_rescue.config import get_config
 from gce_rescue.tasks.keeper import wait_for_operation, wait_for_os_boot
-from typing import Dict
+from googleapiclient.errors import HttpError
+from typing import Dict, List
+import functools
 import logging
 
 _logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def _read_startup_script(file_name: str) -> str:
+  """Startup script template, read from disk once per file."""
+  with open(file_name, encoding='utf-8') as file:
+    return file.read()
+
 def set_metadata(vm) -> Dict:
   """Configure Instance custom metadata.
   https://cloud.google.com/compute/docs/reference/rest/v1/instances/setMetadata
@@ -30,10 +38,9 @@ def set_metadata(vm) -> Dict:
 
   startup_script_file = get_config('startup-script-file')
   device_name = vm.disks['device_name']
-  with open(startup_script_file, encoding='utf-8') as file:
-    file_content = file.read()
-    file_content = file_content.replace('GOOGLE_DISK_NAME', device_name)
-    file_content = file_content.replace('GOOGLE_TS', str(vm.ts))
+  file_content = _read_startup_script(startup_script_file)
+  file_content = file_content.replace('GOOGLE_DISK_NAME', device_name)
+  file_content = file_content.replace('GOOGLE_TS', str(vm.ts))
 
   metadata_body = {
     'fingerprint': vm.data['metadata']['fingerprint'],
@@ -53,29 +60,44 @@ def set_metadata(vm) -> Dict:
   return result
 
 
+def _set_metadata_items(vm, items: List[Dict]) -> Dict:
+  """Replace metadata.items using the fingerprint held in vm.data."""
+  metadata_body = {
+    'fingerprint': vm.data['metadata']['fingerprint'],
+    'items': items
+  }
+  return vm.compute.instances().setMetadata(
+    **vm.project_data,
+    instance = vm.name,
+    body = metadata_body).execute()
+
+
 def restore_metadata_items(vm, remove_rescue_mode: bool = False) -> Dict:
   """Restore original metadata.items after the instance is running again."""
 
-  vm.refresh_fingerprint()
-
   if not remove_rescue_mode:
+    # set_metadata() already changed the metadata, so the fingerprint is stale.
+    vm.refresh_fingerprint()
     vm.backup_items.append({ 'key': 'rescue-mode', 'value': vm.ts })
   else:
-    vm.backup_items.remove({ 'key': 'rescue-mode', 'value': vm.ts })
+    vm.backup_items = [
+      item for item in vm.backup_items if item['key'] != 'rescue-mode'
+    ]
 
-  metadata_body = {
-    'fingerprint': vm.data['metadata']['fingerprint'],
-    'items': vm.backup_items
-  }
   _logger.info('Restoring original metadata...')
 
   # gce-rescue/issues/21 - continue after wait period timed out
   if not remove_rescue_mode:
     wait_for_os_boot(vm)
 
-  operation = vm.compute.instances().setMetadata(
-    **vm.project_data,
-    instance = vm.name,
-    body = metadata_body).execute()
+  try:
+    operation = _set_metadata_items(vm, vm.backup_items)
+  except HttpError as e:
+    if e.status_code != 412:
+      raise
+    # conditionNotMet: metadata changed since it was read, retry once.
+    _logger.info('Metadata fingerprint is outdated. Refreshing...')
+    vm.refresh_fingerprint()
+    operation = _set_metadata_items(vm, vm.backup_items)
   result = wait_for_operation(vm, oper=operation)
   return result
@@ -43,6 +43,31 @@ class MetadataTest(absltest.TestCase):
     result = metadata.restore_metadata_items(self.vm)
     self.assertTrue(len(result)> 1)
 
+
+  def test_remove_rescue_mode_reuses_fingerprint(self):
+    """Leaving rescue mode must not GET the instance again."""
+    self.vm.backup_items.append({'key': 'rescue-mode', 'value': self.vm.ts})
+    self.vm.compute = mock_api_object(['operations'])
+    result = metadata.restore_metadata_items(
+      self.vm, remove_rescue_mode=True)
+    self.assertEqual(result['status'], 'DONE')
+    self.assertNotIn(
+      {'key': 'rescue-mode', 'value': self.vm.ts}, self.vm.backup_items)
+
+  def test_restore_metadata_retries_stale_fingerprint(self):
+    """A 412 from setMetadata refreshes the fingerprint and retries once."""
+    self.vm.backup_items.append({'key': 'rescue-mode', 'value': self.vm.ts})
+    self.vm.data['metadata']['fingerprint'] = 'stale'
+    self.vm.compute = mock_api_object([
+      'precondition_failed',
+      'compute',
+      'operations',
+    ])
+    result = metadata.restore_metadata_items(
+      self.vm, remove_rescue_mode=True)
+    self.assertEqual(result['status'], 'DONE')
+    self.assertEqual(self.vm.data['metadata']['fingerprint'], 'cRcIE4_rlPM=')
+
 if __name__ == '__main__':
   absltest.main()
 
@@ -20,37 +20,31 @@ import logging
 
 _logger = logging.getLogger(__name__)
 
-def start_instance(vm: Instance) -> str:
-  """Start instance."""
-
-  _logger.info('Starting %s...', vm.name)
-  if vm.status == 'RUNNING':
-    _logger.info('%s is already runnning.', vm.name)
-    return
-
-  operation = vm.compute.instances().start(
+def _set_instance_status(vm: Instance, method: str, status: str) -> str:
+  """Call instances().<method>() and wait for it, unless the instance is
+  already in the expected status."""
+  if vm.status == status:
+    _logger.info('%s is already %s.', vm.name, status.lower())
+    return vm.status
+
+  request = getattr(vm.compute.instances(), method)
+  operation = request(
     **vm.project_data,
     instance = vm.name).execute()
   result = wait_for_operation(vm, oper=operation)
 
   if result['status'] == 'DONE':
-    vm.status = 'RUNNING'
+    vm.status = status
   return vm.status
 
 
+def start_instance(vm: Instance) -> str:
+  """Start instance."""
+  _logger.info('Starting %s...', vm.name)
+  return _set_instance_status(vm, 'start', 'RUNNING')
+
+
 def stop_instance(vm: Instance) -> str:
   """Stop instance."""
   _logger.info('Stopping %s...', vm.name)
-  if vm.status == 'TERMINATED':
-    _logger.info('%s is already stopped.', vm.name)
-    return
-
-  operation = vm.compute.instances().stop(
-    **vm.project_data,
-    instance = vm.name).execute()
-  result = wait_for_operation(vm, oper=operation)
-
-  if result['status'] == 'DONE':
-    vm.status = 'TERMINATED'
-  return vm.status
-
+  return _set_instance_status(vm, 'stop', 'TERMINATED')
@@ -17,10 +17,13 @@
     the file under validations/ folder."""
 
 from dataclasses import dataclass, field
+from typing import Dict, Optional
 import googleapiclient.discovery
+from gce_rescue.utils import ThreadHandler as Handler
 from gce_rescue.tasks.validations.authorization import authorize_check
 from gce_rescue.tasks.validations.authentication import (
   authenticate_check,
+  instance_info,
   project_name
 )
 
@@ -44,13 +47,29 @@ class Validations:
     )
 
   def __post_init__(self):
+    # Check permissions in the background while authentication runs.
+    self._authorization = None
     if not self.test_mode:
-      authorize_check(project = self.project)
+      self._authorization = Handler(
+        target = authorize_check,
+        kwargs = {'project': self.project}
+      )
+      self._authorization.daemon = True
+      self._authorization.start()
 
   @property
   def compute(self) -> googleapiclient.discovery.Resource:
-    return self._authentication()
+    service = self._authentication()
+    if self._authorization:
+      self._authorization.result()
+    return service
 
   @property
   def adc_project(self) -> str:
     return project_name()
+
+  @property
+  def instance_data(self) -> Optional[Dict]:
+    """instances().get() response from the authentication probe, set once
+    compute has been read. None in test mode."""
+    return instance_info()
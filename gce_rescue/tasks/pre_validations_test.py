@@ -0,0 +1,65 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test code for pre_validations.py."""
+
+import os
+from unittest import mock
+
+from absl.testing import absltest
+
+from gce_rescue.tasks.pre_validations import Validations
+from gce_rescue.tasks.validations import api
+from gce_rescue.test.mocks import MOCK_TEST_VM
+
+_VALIDATIONS = 'gce_rescue.tasks.validations'
+
+
+class ValidationsTest(absltest.TestCase):
+  def setUp(self):
+    api._default_credentials.cache_clear()  # pylint: disable=protected-access
+    self.addCleanup(
+      api._default_credentials.cache_clear)  # pylint: disable=protected-access
+
+  def test_no_adc_project_uses_gcloud_config_in_both_checks(self):
+    """Without ADC project or --project, authentication and authorization
+    both use the project from the gcloud configuration."""
+    compute = mock.MagicMock()
+    crm = mock.MagicMock()
+    crm.projects().testIamPermissions().execute.return_value = {
+      'permissions': ['compute.snapshots.create']
+    }
+    env = {'CLOUDSDK_CORE_PROJECT': 'config_project'}
+    with mock.patch('google.auth.default', return_value=('credentials', None)), \
+        mock.patch.dict(os.environ, env, clear=True), \
+        mock.patch(f'{_VALIDATIONS}.authentication.api_service',
+                   return_value=compute), \
+        mock.patch(f'{_VALIDATIONS}.authorization.api_service',
+                   return_value=crm):
+      check = Validations(
+        zone=MOCK_TEST_VM['zone'], name=MOCK_TEST_VM['name'], test_mode=False)
+      self.assertIs(check.compute, compute)
+
+    self.assertEqual(check.adc_project, 'config_project')
+    compute.instances().get.assert_called_with(
+      project='config_project',
+      zone=MOCK_TEST_VM['zone'],
+      instance=MOCK_TEST_VM['name'])
+    crm.projects().testIamPermissions.assert_called_with(
+      resource='config_project',
+      body={'permissions': ['compute.snapshots.create']})
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -13,7 +13,14 @@
 # limitations under the License.
 
 """ Common API objects """
+import configparser
+import functools
+import os
+import threading
+from typing import Tuple
+
 import googleapiclient
+import google.auth
 import google_auth_httplib2
 import httplib2
 
@@ -22,23 +29,78 @@ from googleapiclient.discovery import Resource
 
 from gce_rescue.config import VERSION
 
+_USER_AGENT = f'gce_rescue-{VERSION}'
+
+def gcloud_config_project() -> str:
+  """Read core/project from the active gcloud configuration file. Fallback
+  for when google.auth.default() found no project, e.g. because gcloud is
+  not on PATH; it does not save the gcloud call google.auth makes first."""
+  if os.environ.get('CLOUDSDK_CORE_PROJECT'):
+    return os.environ['CLOUDSDK_CORE_PROJECT']
+  config_dir = os.environ.get(
+    'CLOUDSDK_CONFIG',
+    os.path.join(os.path.expanduser('~'), '.config', 'gcloud')
+  )
+  config_name = os.environ.get('CLOUDSDK_ACTIVE_CONFIG_NAME')
+  if not config_name:
+    try:
+      with open(os.path.join(config_dir, 'active_config'),
+                encoding='utf-8') as fd:
+        config_name = fd.read().strip()
+    except OSError:
+      pass
+  config_file = os.path.join(
+    config_dir, 'configurations', f'config_{config_name or "default"}'
+  )
+  parser = configparser.ConfigParser()
+  try:
+    parser.read(config_file, encoding='utf-8')
+  except configparser.Error:
+    return ''
+  return parser.get('core', 'project', fallback='')
+
+_CREDENTIALS_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _default_credentials() -> Tuple[Credentials, str]:
+  credentials, project = google.auth.default()
+  return credentials, project or gcloud_config_project()
+
+def default_credentials() -> Tuple[Credentials, str]:
+  """Application Default Credentials and project, resolved once per process.
+  google.auth.default() may fork a `gcloud` subprocess to find the project,
+  so authorization and authentication share the same lookup, including the
+  gcloud config file fallback. lru_cache doesn't lock a cache miss, so
+  concurrent callers are serialized here."""
+  with _CREDENTIALS_LOCK:
+    return _default_credentials()
+
 def api_service(
     service: str,
     version: str,
     credentials: Credentials) -> Resource:
 
+  local = threading.local()
+
   def _builder(http, *args, **kwargs):
     # google api client is not thread safe
     # https://github.com/googleapis/google-api-python-client/blob/main/docs/thread_safety.md
+    # Keep one authorized connection per thread and reuse it across requests.
     del http
     headers = kwargs.setdefault('headers',{})
-    headers['user-agent'] = f'gce_rescue-{VERSION}'
-    auth_http = google_auth_httplib2.AuthorizedHttp(credentials,
-                                                   http=httplib2.Http())
+    headers['user-agent'] = _USER_AGENT
+    auth_http = getattr(local, 'http', None)
+    if auth_http is None:
+      auth_http = google_auth_httplib2.AuthorizedHttp(credentials,
+                                                     http=httplib2.Http())
+      local.http = auth_http
     return googleapiclient.http.HttpRequest(auth_http, *args, **kwargs)
 
+  # Use the discovery document bundled with google-api-python-client
+  # instead of fetching it over the network on every run.
   service_ = googleapiclient.discovery.build(service, version,
                         cache_discovery=False,
+                        static_discovery=True,
                         credentials=credentials,
                         requestBuilder=_builder)
   return service_
@@ -0,0 +1,102 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test code for api.py."""
+
+import os
+import tempfile
+import time
+from unittest import mock
+
+from absl.testing import absltest
+
+from gce_rescue.tasks.validations import api
+from gce_rescue.utils import ThreadHandler as Handler
+
+
+class DefaultCredentialsTest(absltest.TestCase):
+  def setUp(self):
+    api._default_credentials.cache_clear()  # pylint: disable=protected-access
+    self.addCleanup(
+      api._default_credentials.cache_clear)  # pylint: disable=protected-access
+
+
+  def test_concurrent_callers_resolve_once(self):
+    def slow_default():
+      time.sleep(0.3)
+      return 'credentials', 'project'
+
+    with mock.patch('google.auth.default', side_effect=slow_default) as auth:
+      threads = [Handler(target=api.default_credentials) for _ in range(2)]
+      for thread in threads:
+        thread.start()
+      results = [thread.result() for thread in threads]
+
+    auth.assert_called_once()
+    self.assertEqual(results, [('credentials', 'project')] * 2)
+
+
+  def test_falls_back_to_gcloud_config_project(self):
+    """Use the gcloud config project when ADC has none."""
+    env = {'CLOUDSDK_CORE_PROJECT': 'config_project'}
+    with mock.patch('google.auth.default', return_value=('credentials', None)), \
+        mock.patch.dict(os.environ, env, clear=True):
+      self.assertEqual(
+        api.default_credentials(), ('credentials', 'config_project'))
+
+
+class GcloudConfigProjectTest(absltest.TestCase):
+
+
+  def setUp(self):
+    tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    self.addCleanup(tmp_dir.cleanup)
+    self.config_dir = tmp_dir.name
+    os.makedirs(os.path.join(self.config_dir, 'configurations'))
+    self.env = {'CLOUDSDK_CONFIG': self.config_dir}
+
+
+  def _write_config(self, name, project):
+    file_name = os.path.join(self.config_dir, 'configurations',
+                             f'config_{name}')
+    with open(file_name, 'w', encoding='utf-8') as fd:
+      fd.write(f'[core]\nproject = {project}\n')
+
+
+  def test_gcloud_config_project_default(self):
+    """Read core/project from config_default when no config is active."""
+    self._write_config('default', 'mock_project')
+    with mock.patch.dict(os.environ, self.env, clear=True):
+      self.assertEqual(api.gcloud_config_project(), 'mock_project')
+
+
+  def test_gcloud_config_project_active_config(self):
+    """Follow the active_config file to the named configuration."""
+    self._write_config('default', 'mock_project')
+    self._write_config('other', 'other_project')
+    with open(os.path.join(self.config_dir, 'active_config'), 'w',
+              encoding='utf-8') as fd:
+      fd.write('other\n')
+    with mock.patch.dict(os.environ, self.env, clear=True):
+      self.assertEqual(api.gcloud_config_project(), 'other_project')
+
+
+  def test_gcloud_config_project_missing(self):
+    """Return an empty project when there is no gcloud configuration."""
+    with mock.patch.dict(os.environ, self.env, clear=True):
+      self.assertEqual(api.gcloud_config_project(), '')
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -16,19 +16,31 @@
 import google.auth
 import sys
 
+from typing import Dict, Optional
 from googleapiclient.discovery import Resource
-from gce_rescue.tasks.validations.api import api_service
-from gce_rescue.test.mocks import mock_api_object
+from gce_rescue.tasks.validations.api import api_service, default_credentials
 
 PROJECT = ''
+INSTANCE = None
+
+_INFO_AUTH_REFRESH = (
+  '    Please use application-default Credentials (ADC) to authenticate:\n'
+  '    $ gcloud auth login --update-adc'
+)
+
+_INFO_NO_PROJECT = (
+  '    Was not possible to find the project where the VM is created.\n'
+  '    You can use the option --project to declare the project-id or '
+  'set to your configuration:\n'
+  '    $ gcloud config set project PROJECT_ID'
+)
 
 def _get_auth():
   global PROJECT
   try:
-    credentials, adc_project = google.auth.default()
+    credentials, adc_project = default_credentials()
     if not adc_project and not PROJECT:
-      msg = _info_no_project()
-      print(msg, file=sys.stderr)
+      print(_INFO_NO_PROJECT, file=sys.stderr)
       sys.exit(1)
     if not PROJECT and adc_project:
       PROJECT = adc_project
@@ -44,9 +56,13 @@ def authenticate_check(
   project: str = None,
   test_mode: bool = False
 ) -> Resource:
-  global PROJECT
+  global PROJECT, INSTANCE
   PROJECT = project
+  INSTANCE = None
   if test_mode:
+    # Only tests need the mock API, keep it out of the normal import path.
+    # pylint: disable=import-outside-toplevel
+    from gce_rescue.test.mocks import mock_api_object
     service = mock_api_object(['compute'])
     return service
   credentials = _get_auth()
@@ -63,21 +79,18 @@ def authenticate_check(
 		zone = zone,
 		instance = instance_name)
   try:
-    request.execute()
+    # Keep the probe response so Instance() doesn't GET the VM again.
+    INSTANCE = request.execute()
     return service
   except google.auth.exceptions.RefreshError:
-    msg = _info_auth_refresh()
-    print(msg, file=sys.stderr)
+    print(_INFO_AUTH_REFRESH, file=sys.stderr)
     sys.exit(1)
 
 def project_name() -> str:
   return PROJECT
 
-def _info_auth_refresh() -> str:
-  return (
-	'    Please use application-default Credentials (ADC) to authenticate:\n'
-	'    $ gcloud auth login --update-adc'
-  )
+def instance_info() -> Optional[Dict]:
+  return INSTANCE
 
 def _info_auth_cred() -> str:
   return (
@@ -85,11 +98,3 @@ def _info_auth_cred() -> str:
 	'     $ gcloud auth application-default login\n'
 	f'     $ gcloud auth application-default set-quota-project {PROJECT}'
   )
-
-def _info_no_project() -> str:
-  return (
-	'    Was not possible to find the project where the VM is created.\n'
-	'    You can use the option --project to declare the project-id or '
-  'set to your configuration:\n'
-	'    $ gcloud config set project PROJECT_ID'
-  )
@@ -27,25 +27,28 @@ Permissions:
   compute.instances.setMetadata
   compute.instances.setLabels
 """
-import google.auth
-from gce_rescue.tasks.validations.api import api_service
+from gce_rescue.tasks.validations.api import api_service, default_credentials
+
+_REQUIRED_PERMISSIONS = frozenset({'compute.snapshots.create'})
+_BODY_DATA = {'permissions': sorted(_REQUIRED_PERMISSIONS)}
 
 def authorize_check(project: str = None) -> bool:
 
-  permissions_list = ['compute.snapshots.create']
-  body_data = {'permissions': permissions_list}
-  credentials, project_id = google.auth.default()
+  credentials, project_id = default_credentials()
 
   if not project:
     project = project_id
 
   service = api_service('cloudresourcemanager', 'v1', credentials)
+  # testIamPermissions returns intermittent 503s, retry those with backoff.
   result = service.projects().testIamPermissions(
     resource = project,
-    body =  body_data
-  ).execute()
+    body =  _BODY_DATA
+  ).execute(num_retries=3)
 
-  if permissions_list != result['permissions']:
+  # The response omits 'permissions' when none of them is granted, and the
+  # order of the granted ones is not guaranteed.
+  if not _REQUIRED_PERMISSIONS.issubset(result.get('permissions', [])):
     raise PermissionError()
 
   return True
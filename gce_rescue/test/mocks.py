@@ -15,7 +15,6 @@
 """Mock API for tests purposes."""
 
 import os
-import pathlib
 import json
 from typing import List
 import googleapiclient.discovery
@@ -45,17 +44,28 @@ mock_data = {
 }
 
 
+# Error responses, by HTTP status code.
+mock_errors = {
+  'not_found': '404',
+  'precondition_failed': '412',
+}
+
+
 def mock_api_object(mocks_list: List[str]):
   """ Returns mock HTTP sequence Resources to be used in API tests calls """
   responses = []
   for mock in mocks_list:
+    if mock in mock_errors:
+      responses.append(({'status': mock_errors[mock]}, '{}'))
+      continue
     if mock not in mock_data:
       raise Exception(ValueError, mock)
     file_name = os.path.join(os.path.dirname(__file__), mock_data[mock])
-    if not pathlib.Path(file_name).is_file():
-      raise Exception(FileNotFoundError, file_name)
-    with open(file_name, encoding='utf-8') as fd:
-      data = json.load(fd)
+    try:
+      with open(file_name, encoding='utf-8') as fd:
+        data = json.load(fd)
+    except FileNotFoundError as e:
+      raise Exception(FileNotFoundError, file_name) from e
     responses.append(
       ({'status': '200'}, json.dumps(data))
     )
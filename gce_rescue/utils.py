@@ -17,6 +17,7 @@
 """ List of classes and functions to be used across the code. """
 
 from time import sleep
+import itertools
 import logging
 import multiprocessing
 from threading import Thread
@@ -26,9 +27,18 @@ from gce_rescue.config import get_config
 
 _logger = logging.getLogger(__name__)
 
+_LOG_FORMAT = ('%(asctime)s,%(msecs)03d %(levelname)-8s '
+               '[%(filename)s:%(lineno)d]      %(message)s')
+_LOG_DATEFMT = '%Y-%m-%d:%H:%M:%S'
+
 class Tracker():
   """ Track tasks using multiprocessing and print progress bar. """
 
+  _BAR_SIZE = 60
+  _SPINNER = ('-', '|', '/', '|', '\\')
+  # Redraw interval in seconds, fast enough for the spinner to look alive.
+  _TICK = 0.1
+
   def __init__(self, target):
     self.target = target
     self._pivot = multiprocessing.Value('i', 1)
@@ -47,23 +57,13 @@ class Tracker():
   def finish(self):
     self._pivot.value = self.target
     self._proc.join()
-    sleep(0.5)
     print('├── Configurations finished.')
 
-  def _loading(self):
-    chars = ['-', '|', '/', '|', '\\']
-    i = 0
-    while True:
-      yield chars[i]
-      i += 1
-      if i == len(chars):
-        i = 0
-
   def _run(self):
-    self._gen = self._loading()
+    self._gen = itertools.cycle(self._SPINNER)
     while self._pivot.value < self.target:
       try:
-        sleep(0.001)
+        sleep(self._TICK)
         self._print()
       except Exception as exc:
         raise Exception(f'{exc}: {self._pivot.value} = {self.target}') from exc
@@ -72,19 +72,18 @@ class Tracker():
     print('\r')
 
   def _print(self):
-    size = 60
+    size = self._BAR_SIZE
     loading = next(self._gen)
-    if self._pivot.value == self.target:
-      loading = '█'
     count = self._pivot.value
     total = self.target
-    x = int(size * self._pivot.value / self.target)
+    if count == total:
+      loading = '█'
+    x = int(size * count / total)
     progress = '█' * x
     bar = '.' * (size-x)
-    print(f'│   └── Progress {count}/{total} [{progress}{loading}{bar}]',
-      end='\r',
-      file=sys.stderr,
-      flush=True)
+    sys.stderr.write(
+      f'│   └── Progress {count}/{total} [{progress}{loading}{bar}]\r')
+    sys.stderr.flush()
 
 
 class ThreadHandler(Thread):
@@ -107,36 +106,40 @@ class ThreadHandler(Thread):
 
     Thread.__init__(self, group, target, name, args, kwargs)
     self._result = None
+    self._exception = None
 
   def run(self):
     if self._target is not None:
-      self._result = self._target(*self._args, **self._kwargs)
+      try:
+        self._result = self._target(*self._args, **self._kwargs)
+      except BaseException as e:  # pylint: disable=broad-exception-caught
+        self._exception = e
 
   def result(self, *args):
+    """Wait for the thread and return the target's result, re-raising any
+    exception it raised."""
     Thread.join(self, *args)
+    if self._exception is not None:
+      raise self._exception
     return self._result
 
 
 def set_logging(vm_name: str) -> None:
   """ Set logfile and verbosity. """
 
-  level = 'DEBUG' if get_config('debug') else 'INFO'
-  log_level = getattr(logging, level.upper())
+  log_level = logging.DEBUG if get_config('debug') else logging.INFO
   file_name = f'{vm_name}.log'
   logging.basicConfig(
     filename=file_name,
     filemode='a',
-    format='%(asctime)s,%(msecs)03d %(levelname)-8s [%(filename)s:%(lineno)d]\
-      %(message)s',
-    datefmt='%Y-%m-%d:%H:%M:%S',
+    format=_LOG_FORMAT,
+    datefmt=_LOG_DATEFMT,
     level=log_level)
 
 
 def read_input(msg: str) -> None:
   """Read user input if --force is not provided."""
-  print(msg, end='')
-  input_answer = input()
-  input_answer = input_answer.strip()
+  input_answer = input(msg).strip()
   if input_answer.upper() != 'Y':
     print(f'got input: "{input_answer}". Aborting')
     sys.exit(1)
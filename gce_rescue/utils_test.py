@@ -59,6 +59,15 @@ class MultitasksTest(absltest.TestCase):
     self.assertTrue(MultitasksTest.status['task1_done'])
     self.assertTrue(MultitasksTest.status['task2_done'])
 
+  def test_result_raises_target_exception(self):
+    def failing_task():
+      raise PermissionError('denied')
+
+    t = Handler(target=failing_task)
+    t.start()
+    with self.assertRaises(PermissionError):
+      t.result()
+
 
 if __name__ == '__main__':
   absltest.main()